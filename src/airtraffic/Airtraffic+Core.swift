@@ -17,11 +17,17 @@ extension Airtraffic {
         return URL(fileURLWithPath: arg0, relativeTo: URL(fileURLWithPath: cwd)).standardizedFileURL
     }
 
-    static func startCollectorIfNeeded() {
+    /// Returns whether a collector was already running, so callers that report it don't have to
+    /// repeat the `launchctl print` via `isCollectorProbablyRunning()`.
+    @discardableResult
+    static func startCollectorIfNeeded() -> Bool {
         let desiredExe = currentExecutableURL().path
-        if isCollectorProbablyRunning() {
-            if runningCollectorProgramPathFromLaunchctl() == desiredExe {
-                return
+        // One `launchctl print` answers both "is it running?" and "which binary is it running?".
+        let job = collectorJobFromLaunchctl()
+        let wasRunning = hasFreshState() || job?.isAlive == true
+        if wasRunning {
+            if job?.program == desiredExe {
+                return true
             }
             // Migration path: collector is up, but using a different executable path.
             launchctlBootout()
@@ -35,55 +41,35 @@ extension Airtraffic {
         child.standardOutput = FileHandle.nullDevice
         child.standardError = FileHandle.nullDevice
         try? child.run()
+        return wasRunning
     }
 
     static func isCollectorProbablyRunning(activeStateThresholdSeconds: TimeInterval = 10) -> Bool {
-        if let state = AirtrafficState.load() {
-            let now = Date()
-            if now.timeIntervalSince(state.lastUpdate) < activeStateThresholdSeconds {
-                return true
-            }
+        if hasFreshState(activeStateThresholdSeconds: activeStateThresholdSeconds) {
+            return true
         }
+        return collectorJobFromLaunchctl()?.isAlive ?? false
+    }
 
-        guard let pid = runningCollectorPIDFromLaunchctl() else { return false }
-        // `kill(pid, 0)` doesn't actually signal; it checks for existence/permission.
-        return kill(pid, 0) == 0
+    private static func hasFreshState(activeStateThresholdSeconds: TimeInterval = 10) -> Bool {
+        guard let heartbeat = AirtrafficState.loadHeartbeat() else { return false }
+        return Date().timeIntervalSince(heartbeat.lastUpdate) < activeStateThresholdSeconds
     }
 
-    private static func runningCollectorPIDFromLaunchctl() -> pid_t? {
-        let uid = getuid()
-        let context = "gui/\(uid)/\(LoginItemInstaller.label)"
+    /// The collector job as launchd reports it.
+    private struct LaunchdJob {
+        var pid: pid_t?
+        var program: String?
 
-        let proc = Process()
-        proc.executableURL = URL(fileURLWithPath: "/bin/launchctl")
-        proc.arguments = ["print", context]
-        let pipe = Pipe()
-        proc.standardOutput = pipe
-        proc.standardError = FileHandle.nullDevice
-        do {
-            try proc.run()
-        } catch {
-            return nil
+        /// `kill(pid, 0)` doesn't actually signal; it checks for existence/permission.
+        var isAlive: Bool {
+            guard let pid else { return false }
+            return kill(pid, 0) == 0
         }
-        proc.waitUntilExit()
-        guard proc.terminationStatus == 0 else { return nil }
-
-        let output = String(data: pipe.fileHandleForReading.readDataToEndOfFile(), encoding: .utf8) ?? ""
-        // Example line: "pid = 12345"
-        for line in output.split(separator: "\n") {
-            let trimmed = line.trimmingCharacters(in: .whitespacesAndNewlines)
-            guard trimmed.hasPrefix("pid =") else { continue }
-            let parts = trimmed.split(separator: " ")
-            if let last = parts.last, let pid = Int32(last) {
-                return pid_t(pid)
-            }
-        }
-        return nil
     }
 
-    private static func runningCollectorProgramPathFromLaunchctl() -> String? {
-        let uid = getuid()
-        let context = "gui/\(uid)/\(LoginItemInstaller.label)"
+    private static func collectorJobFromLaunchctl() -> LaunchdJob? {
+        let context = "\(LoginItemInstaller.launchdDomain)/\(LoginItemInstaller.label)"
 
         let proc = Process()
         proc.executableURL = URL(fileURLWithPath: "/bin/launchctl")
@@ -96,17 +82,27 @@ extension Airtraffic {
         } catch {
             return nil
         }
+        let data = pipe.fileHandleForReading.readDataToEndOfFile()
         proc.waitUntilExit()
         guard proc.terminationStatus == 0 else { return nil }
 
-        let output = String(data: pipe.fileHandleForReading.readDataToEndOfFile(), encoding: .utf8) ?? ""
-        // Example line: "program = /path/to/airtraffic"
+        let output = String(data: data, encoding: .utf8) ?? ""
+        var job = LaunchdJob()
+        // Example lines: "pid = 12345", "program = /path/to/airtraffic"
+        // Both sit near the top of a long dump (environment, endpoints, ...), so stop once found.
         for line in output.split(separator: "\n") {
-            let trimmed = line.trimmingCharacters(in: .whitespacesAndNewlines)
-            guard trimmed.hasPrefix("program =") else { continue }
-            return String(trimmed.dropFirst("program =".count)).trimmingCharacters(in: .whitespaces)
+            let trimmed = line.drop(while: { $0.isWhitespace })
+            if job.pid == nil, trimmed.hasPrefix("pid =") {
+                let parts = trimmed.split(separator: " ")
+                if let last = parts.last, let pid = Int32(last) {
+                    job.pid = pid_t(pid)
+                }
+            } else if job.program == nil, trimmed.hasPrefix("program =") {
+                job.program = trimmed.dropFirst("program =".count).trimmingCharacters(in: .whitespaces)
+            }
+            if job.pid != nil, job.program != nil { break }
         }
-        return nil
+        return job
     }
 
     /// Fires a macOS local notification. Requests permission on first call.
@@ -132,18 +128,38 @@ extension Airtraffic {
         }
     }
 
+    /// `swift run` binaries live under .build/ with no app bundle for UserNotifications to attach to.
+    private static let runsFromBuildDirectory = Bundle.main.bundleURL.path.contains("/.build/")
+
     static func shouldUseAppleScriptNotifications() -> Bool {
-        let bundleURLPath = Bundle.main.bundleURL.path
-        return bundleURLPath.contains("/.build/")
+        runsFromBuildDirectory
+    }
+
+    /// Fires every notification in the batch. On the AppleScript path they share one osascript process.
+    static func sendLimitNotifications(_ notifications: [(title: String, body: String)]) {
+        guard !notifications.isEmpty else { return }
+        if shouldUseAppleScriptNotifications() {
+            sendAppleScriptNotifications(notifications)
+            return
+        }
+        for notification in notifications {
+            sendLimitNotification(title: notification.title, body: notification.body)
+        }
     }
 
     static func sendAppleScriptNotification(title: String, body: String) {
+        sendAppleScriptNotifications([(title: title, body: body)])
+    }
+
+    static func sendAppleScriptNotifications(_ notifications: [(title: String, body: String)]) {
         let process = Process()
         process.executableURL = URL(fileURLWithPath: "/usr/bin/osascript")
-        process.arguments = [
-            "-e",
-            "display notification \(appleScriptQuoted(body)) with title \(appleScriptQuoted(title)) sound name \"default\""
-        ]
+        process.arguments = notifications.flatMap { notification in
+            [
+                "-e",
+                "display notification \(appleScriptQuoted(notification.body)) with title \(appleScriptQuoted(notification.title)) sound name \"default\""
+            ]
+        }
         process.standardOutput = FileHandle.nullDevice
         process.standardError = FileHandle.nullDevice
         try? process.run()
@@ -157,28 +173,23 @@ extension Airtraffic {
     }
 
     static func collectorLogURL() -> URL {
-        let fm = FileManager.default
-        let base = fm.urls(for: .applicationSupportDirectory, in: .userDomainMask).first
-            ?? URL(fileURLWithPath: NSHomeDirectory()).appendingPathComponent("Library/Application Support", isDirectory: true)
-        let dir = base.appendingPathComponent("airtraffic", isDirectory: true)
-        try? fm.createDirectory(at: dir, withIntermediateDirectories: true)
-        return dir.appendingPathComponent("collector.log")
+        AirtrafficState.dataDirectory.appendingPathComponent("collector.log")
     }
 
     static func logCollectorError(_ error: Error) {
         let timestamp = ISO8601DateFormatter().string(from: Date())
         let line = "[\(timestamp)] collector tick failed: \(String(describing: error))\n"
-        let logURL = collectorLogURL()
-        if let data = line.data(using: .utf8) {
-            if FileManager.default.fileExists(atPath: logURL.path),
-               let handle = try? FileHandle(forWritingTo: logURL) {
-                defer { try? handle.close() }
-                _ = try? handle.seekToEnd()
-                try? handle.write(contentsOf: data)
-            } else {
-                try? data.write(to: logURL, options: .atomic)
-            }
+        // O_APPEND|O_CREAT: one open and one write per line, whether or not the log exists yet.
+        let path = collectorLogURL().path
+        var fd = open(path, O_WRONLY | O_APPEND | O_CREAT, 0o644)
+        if fd < 0 {
+            AirtrafficState.createDataDirectory()
+            fd = open(path, O_WRONLY | O_APPEND | O_CREAT, 0o644)
         }
+        guard fd >= 0 else { return }
+        defer { close(fd) }
+        let bytes = Array(line.utf8)
+        _ = bytes.withUnsafeBytes { write(fd, $0.baseAddress, $0.count) }
     }
 
     static func runCollector(interval: TimeInterval) async {
@@ -206,75 +217,73 @@ extension Airtraffic {
                     guard !rows.isEmpty else { return }
                     let byApp = aggregateByApp(rows, resolver: resolver)
                     let now = Date()
+                    // Calendar.current builds a fresh value on every access; fetch it once per tick
+                    // (not once per process, so time zone changes still take effect).
+                    let calendar = Calendar.current
 
-                    if !Calendar.current.isDate(now, inSameDayAs: state.todayStart) {
+                    if !calendar.isDate(now, inSameDayAs: state.todayStart) {
                         state.resetToday(now: now)
                     }
 
                     if let monthStart = state.monthStart,
-                       !Calendar.current.isDate(now, equalTo: monthStart, toGranularity: .month) {
-                        let calendar = Calendar.current
+                       !calendar.isDate(now, equalTo: monthStart, toGranularity: .month) {
                         let midnight = calendar.startOfDay(for: now)
                         state.monthStart = calendar.date(from: calendar.dateComponents([.year, .month], from: now)) ?? midnight
                         state.monthByApp = [:]
                     }
 
+                    // The since window is the same for every app this tick; decide it once.
+                    let sinceActive = state.sinceStart.map { now >= $0 } ?? false
+
                     for row in byApp {
                         let key = row.name
-                        let previous = state.lastSnapshot[key] ?? AppUsage(bytesIn: 0, bytesOut: 0)
+                        let previous = state.lastSnapshot.updateValue(
+                            AppUsage(bytesIn: row.bytesIn, bytesOut: row.bytesOut),
+                            forKey: key
+                        ) ?? .zero
                         // If per-process counters reset/restart, treat current sample as new baseline traffic
                         // (same behavior as `live`) instead of dropping the app from cumulative views.
                         let dIn = row.bytesIn >= previous.bytesIn ? row.bytesIn - previous.bytesIn : row.bytesIn
                         let dOut = row.bytesOut >= previous.bytesOut ? row.bytesOut - previous.bytesOut : row.bytesOut
-                        state.lastSnapshot[key] = AppUsage(bytesIn: row.bytesIn, bytesOut: row.bytesOut)
                         if dIn == 0 && dOut == 0 { continue }
 
-                        var todayUsage = state.todayByApp[key] ?? AppUsage(bytesIn: 0, bytesOut: 0)
-                        todayUsage.bytesIn &+= dIn
-                        todayUsage.bytesOut &+= dOut
-                        state.todayByApp[key] = todayUsage
-
-                        var monthUsage = state.monthByApp[key] ?? AppUsage(bytesIn: 0, bytesOut: 0)
-                        monthUsage.bytesIn &+= dIn
-                        monthUsage.bytesOut &+= dOut
-                        state.monthByApp[key] = monthUsage
-
-                        if let sinceStart = state.sinceStart, now >= sinceStart {
-                            var sinceUsage = state.sinceByApp[key] ?? AppUsage(bytesIn: 0, bytesOut: 0)
-                            sinceUsage.bytesIn &+= dIn
-                            sinceUsage.bytesOut &+= dOut
-                            state.sinceByApp[key] = sinceUsage
+                        state.todayByApp[key, default: .zero].add(bytesIn: dIn, bytesOut: dOut)
+                        state.monthByApp[key, default: .zero].add(bytesIn: dIn, bytesOut: dOut)
+                        if sinceActive {
+                            state.sinceByApp[key, default: .zero].add(bytesIn: dIn, bytesOut: dOut)
                         }
                     }
 
                     state.lastUpdate = now
-                    state.persist()
 
+                    var notifications: [(title: String, body: String)] = []
                     for (app, cap) in state.limits {
                         guard !state.notifiedLimits.contains(app) else { continue }
                         let usage = state.todayByApp[app]
                         let used = (usage?.bytesIn ?? 0) + (usage?.bytesOut ?? 0)
                         if used >= cap {
-                            sendLimitNotification(
+                            notifications.append((
                                 title: "\(app) data limit reached",
                                 body: "\(app) has used \(formatBytesLimit(used)) today (limit: \(formatBytesLimit(cap)))."
-                            )
+                            ))
                             state.notifiedLimits.insert(app)
-                            state.persist()
                         }
                     }
 
                     if let totalCap = state.totalLimit, !state.notifiedLimits.contains("__total__") {
                         let totalUsed = state.todayByApp.values.reduce(UInt64(0)) { $0 + $1.bytesIn + $1.bytesOut }
                         if totalUsed >= totalCap {
-                            sendLimitNotification(
+                            notifications.append((
                                 title: "Daily data limit reached",
                                 body: "Total usage today is \(formatBytesLimit(totalUsed)) (limit: \(formatBytesLimit(totalCap)))."
-                            )
+                            ))
                             state.notifiedLimits.insert("__total__")
-                            state.persist()
                         }
                     }
+
+                    // One write per tick covers both the usage deltas and any limits notified above.
+                    state.persist()
+                    sendLimitNotifications(notifications)
                 } catch {
                     logCollectorError(error)
                     return
@@ -291,18 +300,17 @@ extension Airtraffic {
         var sum: [String: (displayName: String, bytesIn: UInt64, bytesOut: UInt64)] = [:]
         for row in rows {
             let resolved = resolver.resolve(forPID: row.pid, fallbackProcessName: row.name)
-            if shouldIgnoreAppFromUsageTables(resolved.displayName) { continue }
             let existing = sum[resolved.groupKey] ?? (resolved.displayName, 0, 0)
             sum[resolved.groupKey] = (existing.0, existing.1 + row.bytesIn, existing.2 + row.bytesOut)
         }
-        return sum.map { (name: $0.value.displayName, bytesIn: $0.value.bytesIn, bytesOut: $0.value.bytesOut) }
+        return sum.compactMap { entry -> (name: String, bytesIn: UInt64, bytesOut: UInt64)? in
+            if shouldIgnoreAppFromUsageTables(entry.value.displayName) { return nil }
+            return (name: entry.value.displayName, bytesIn: entry.value.bytesIn, bytesOut: entry.value.bytesOut)
+        }
     }
 
     static func shouldIgnoreAppFromUsageTables(_ appName: String) -> Bool {
-        let normalized = appName.lowercased()
-            .replacingOccurrences(of: " ", with: "")
-            .replacingOccurrences(of: "-", with: "")
-            .replacingOccurrences(of: "_", with: "")
+        let normalized = appName.lowercased().filter { $0 != " " && $0 != "-" && $0 != "_" }
 
         if normalized.contains("mdnsresponder") || normalized.contains("mdnshelper") { return true }
         let wordCount = appName.split(separator: " ").count
@@ -313,6 +321,8 @@ extension Airtraffic {
     static let colDown = 12
     static let colUp = 12
     static let colTotal = 10
+    /// Rule drawn under table headers and above TOTAL rows.
+    static let tableSeparator = String(repeating: "─", count: 4 + 1 + (colName - 5) + 1 + colDown + 1 + colUp + 1 + colTotal)
 
     static func rowLine(name: String, bytesIn: UInt64, bytesOut: UInt64, interval: TimeInterval) -> String {
         let inRate = Double(bytesIn) / interval
@@ -340,10 +350,20 @@ extension Airtraffic {
     }
 
     static func formatBytes(_ bytes: UInt64) -> String {
-        if bytes >= 1_000_000_000 { return String(format: "%.2f GB", Double(bytes) / 1_000_000_000) }
-        if bytes >= 1_000_000 { return String(format: "%.2f MB", Double(bytes) / 1_000_000) }
-        if bytes >= 1000 { return String(format: "%.2f KB", Double(bytes) / 1000) }
-        return "\(bytes) B"
+        guard bytes >= 1000 else { return "\(bytes) B" }
+        let (unit, suffix): (UInt64, String) = bytes >= 1_000_000_000 ? (1_000_000_000, "GB")
+            : bytes >= 1_000_000 ? (1_000_000, "MB")
+            : (1000, "KB")
+        let step = unit / 100
+        let remainder = bytes % step
+        // Integer hundredths agree with "%.2f" except on exact ties and at petabyte scale, where the
+        // Double quotient decides the rounding; leave those to String(format:).
+        guard remainder * 2 != step, bytes < 1_000_000_000_000_000 else {
+            return String(format: "%.2f \(suffix)", Double(bytes) / Double(unit))
+        }
+        let hundredths = bytes / step + (remainder * 2 > step ? 1 : 0)
+        let fraction = hundredths % 100
+        return "\(hundredths / 100).\(fraction < 10 ? "0" : "")\(fraction) \(suffix)"
     }
 
     static func formatRate(_ bytesPerSec: Double) -> String {
@@ -358,7 +378,7 @@ extension Airtraffic {
         guard FileManager.default.fileExists(atPath: plistURL.path) else { return }
         let proc = Process()
         proc.executableURL = URL(fileURLWithPath: "/bin/launchctl")
-        proc.arguments = ["bootout", "gui/\(getuid())", plistURL.path]
+        proc.arguments = ["bootout", LoginItemInstaller.launchdDomain, plistURL.path]
         proc.standardOutput = FileHandle.nullDevice
         proc.standardError = FileHandle.nullDevice
         try? proc.run()
@@ -370,7 +390,7 @@ extension Airtraffic {
         guard FileManager.default.fileExists(atPath: plistURL.path) else { return }
         let proc = Process()
         proc.executableURL = URL(fileURLWithPath: "/bin/launchctl")
-        proc.arguments = ["bootstrap", "gui/\(getuid())", plistURL.path]
+        proc.arguments = ["bootstrap", LoginItemInstaller.launchdDomain, plistURL.path]
         proc.standardOutput = FileHandle.nullDevice
         proc.standardError = FileHandle.nullDevice
         try? proc.run()
@@ -379,21 +399,51 @@ extension Airtraffic {
 
     static func killExistingDaemons() {
         let myPID = getpid()
-        let proc = Process()
-        proc.executableURL = URL(fileURLWithPath: "/bin/sh")
-        proc.arguments = ["-c", "ps -ax -o pid=,args= | grep 'airtraffic daemon' | grep -v grep"]
-        let pipe = Pipe()
-        proc.standardOutput = pipe
-        proc.standardError = FileHandle.nullDevice
-        try? proc.run()
-        proc.waitUntilExit()
-        let output = String(data: pipe.fileHandleForReading.readDataToEndOfFile(), encoding: .utf8) ?? ""
-        for line in output.split(separator: "\n") {
-            let parts = line.trimmingCharacters(in: .whitespaces).split(separator: " ", maxSplits: 1)
-            if let pidStr = parts.first, let pid = pid_t(pidStr), pid != myPID {
-                kill(pid, SIGTERM)
-            }
+        var signalled = false
+        for pid in runningDaemonPIDs() where pid != myPID {
+            if kill(pid, SIGTERM) == 0 { signalled = true }
+        }
+        // Only wait for shutdown when there was something to shut down.
+        if signalled { usleep(500_000) }
+    }
+
+    /// PIDs whose argv contains "airtraffic daemon".
+    static func runningDaemonPIDs() -> [pid_t] {
+        let estimate = proc_listallpids(nil, 0)
+        guard estimate > 0 else { return [] }
+        // Leave headroom for processes spawned between the sizing call and the real one.
+        var pids = [pid_t](repeating: 0, count: Int(estimate) + 32)
+        let count = pids.withUnsafeMutableBytes { buf in
+            proc_listallpids(buf.baseAddress, Int32(buf.count))
+        }
+        guard count > 0 else { return [] }
+
+        return pids.prefix(Int(count)).filter { pid in
+            // The short name rules out nearly every PID before paying for the full argv read.
+            guard pid > 0, processName(pid: pid)?.contains("airtraffic") == true,
+                  let args = processArguments(pid: pid) else { return false }
+            return args.joined(separator: " ").contains("airtraffic daemon")
         }
-        usleep(500_000)
+    }
+
+    /// Returns the short process name for a PID via proc_name, or nil if it can't be read.
+    static func processName(pid: pid_t) -> String? {
+        var buf = [CChar](repeating: 0, count: 2 * Int(MAXCOMLEN) + 1)
+        guard proc_name(pid, &buf, UInt32(buf.count)) > 0 else { return nil }
+        return String(cString: buf)
+    }
+
+    /// Returns argv for a PID via sysctl(KERN_PROCARGS2), or nil if the process can't be inspected.
+    static func processArguments(pid: pid_t) -> [String]? {
+        var mib: [Int32] = [CTL_KERN, KERN_PROCARGS2, pid]
+        var size = 0
+        guard sysctl(&mib, 3, nil, &size, nil, 0) == 0, size > MemoryLayout<Int32>.size else { return nil }
+        var buffer = [UInt8](repeating: 0, count: size)
+        guard sysctl(&mib, 3, &buffer, &size, nil, 0) == 0, size > MemoryLayout<Int32>.size else { return nil }
+
+        // Layout: argc (Int32), executable path, NUL padding, then argc NUL-terminated arguments.
+        let argc = buffer.withUnsafeBytes { $0.load(as: Int32.self) }
+        let fields = buffer[MemoryLayout<Int32>.size..<size].split(separator: 0)
+        return fields.dropFirst().prefix(Int(argc)).map { String(decoding: $0, as: UTF8.self) }
     }
 }
@@ -22,71 +22,46 @@ extension Airtraffic {
             guard let command = tokens.first else { continue }
             let tail = Array(tokens.dropFirst())
 
-            if command == "help" {
+            switch command {
+            case "help":
                 HelpCommand(args: tail).run()
-                continue
-            }
-            if command == "home" {
+            case "home":
                 renderInteractiveHome()
                 showHomeView = false
-                continue
-            }
-
-            if command == "daemon" {
+            case "daemon":
                 if tail.last != "--daemonized" {
-                    let wasRunning = isCollectorProbablyRunning()
-                    startCollectorIfNeeded()
+                    let wasRunning = startCollectorIfNeeded()
                     print(wasRunning ? "App is already running." : "App started. Running in the background.")
-                    continue
+                } else {
+                    await runCollector(interval: interval)
                 }
-                await runCollector(interval: interval)
-                continue
-            }
-
-            if command == "status" {
+            case "status":
                 StatusCommand().run()
-                continue
-            }
-            if command == "stop" {
+            case "stop":
                 StopCommand().run()
-                continue
-            }
-            if command == "today" {
+            case "today":
                 await TodayCommand().run()
                 showHomeView = true
-                continue
-            }
-            if command == "month" {
+            case "month":
                 await MonthCommand().run()
                 showHomeView = true
-                continue
-            }
-            if command == "since" {
+            case "since":
                 await SinceCommand(args: tail).run()
                 showHomeView = true
-                continue
-            }
-            if command == "export" {
+            case "export":
                 ExportCommand(args: tail).run()
-                continue
-            }
-            if command == "limit" {
+            case "limit":
                 LimitCommand(args: tail).run()
-                continue
-            }
-            if command == "limits" {
+            case "limits":
                 LimitsCommand().run()
-                continue
-            }
-            if command == "live" || command == "once" {
+            case "live", "once":
                 let runOnce = command == "once" || tail.contains("--once")
                 await runLiveCommand(interval: interval, once: runOnce)
                 showHomeView = true
-                continue
+            default:
+                print("Unknown command: \(command)")
+                print("Type 'help' to see available commands.")
             }
-
-            print("Unknown command: \(command)")
-            print("Type 'help' to see available commands.")
         }
     }
 
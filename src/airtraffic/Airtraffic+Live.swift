@@ -28,9 +28,12 @@ extension Airtraffic {
                 let deltas = byApp
                     .filter { ($0.bytesIn + $0.bytesOut) > 0 }
                     .sorted { ($0.bytesIn + $0.bytesOut) > ($1.bytesIn + $1.bytesOut) }
+                // Build the whole listing first so it reaches the terminal in one write.
+                var out = ""
                 for row in deltas.prefix(pageSize) {
-                    ttyWrite(tty, rowLine(name: row.name, bytesIn: row.bytesIn, bytesOut: row.bytesOut, interval: interval) + "\n")
+                    out += rowLine(name: row.name, bytesIn: row.bytesIn, bytesOut: row.bytesOut, interval: interval) + "\n"
                 }
+                ttyWrite(tty, out)
             } catch {
                 ttyWrite(tty, "Error: \(error)\n")
             }
@@ -79,17 +82,19 @@ extension Airtraffic {
                 }
 
                 let byApp = aggregateByApp(rows, resolver: appResolver)
-                var deltas: [(name: String, bytesIn: UInt64, bytesOut: UInt64)] = byApp.map { row in
+                // One pass computes each delta, drops idle apps and builds the next baseline.
+                var deltas: [(name: String, bytesIn: UInt64, bytesOut: UInt64)] = []
+                var nextSnapshot: [String: (bytesIn: UInt64, bytesOut: UInt64)] = [:]
+                nextSnapshot.reserveCapacity(byApp.count)
+                for row in byApp {
                     let (prevIn, prevOut) = lastSnapshot[row.name] ?? (0, 0)
                     let dIn = row.bytesIn >= prevIn ? row.bytesIn - prevIn : row.bytesIn
                     let dOut = row.bytesOut >= prevOut ? row.bytesOut - prevOut : row.bytesOut
-                    return (row.name, dIn, dOut)
+                    nextSnapshot[row.name] = (row.bytesIn, row.bytesOut)
+                    if dIn + dOut > 0 { deltas.append((row.name, dIn, dOut)) }
                 }
-
-                lastSnapshot = Dictionary(uniqueKeysWithValues: byApp.map { ($0.name, ($0.bytesIn, $0.bytesOut)) })
-                deltas = deltas
-                    .filter { ($0.bytesIn + $0.bytesOut) > 0 }
-                    .sorted { ($0.bytesIn + $0.bytesOut) > ($1.bytesIn + $1.bytesOut) }
+                lastSnapshot = nextSnapshot
+                deltas.sort { ($0.bytesIn + $0.bytesOut) > ($1.bytesIn + $1.bytesOut) }
 
                 let totalPages = max(1, Int(ceil(Double(deltas.count) / Double(pageSize))))
                 currentPage = min(currentPage, totalPages - 1)
@@ -100,27 +105,24 @@ extension Airtraffic {
                 let stamp = liveClockFormatter.string(from: Date())
                 var out = terminalResetPrefix()
                 out += "AirTraffic - Live (\(stamp))\n\n"
-                out += fit("No.", width: 4) + " "
-                out += fit("App", width: colName - 5) + " "
-                out += fit("↓ Down/s", width: colDown) + " "
-                out += fit("↑ Up/s", width: colUp) + " "
-                out += fit("Total/s", width: colTotal) + "\n"
-                out += String(repeating: "─", count: 4 + 1 + (colName - 5) + 1 + colDown + 1 + colUp + 1 + colTotal) + "\n"
+                for line in liveHeaderLines { out += line + "\n" }
+                var totalInRate = 0.0
+                var totalOutRate = 0.0
                 for (idx, row) in display.enumerated() {
                     let no = start + idx + 1
                     let inRate = Double(row.bytesIn) / interval
                     let outRate = Double(row.bytesOut) / interval
                     let totalRate = inRate + outRate
+                    totalInRate += inRate
+                    totalOutRate += outRate
                     out += fit("\(no)", width: 4) + " "
                     out += fit(row.name, width: colName - 5) + " "
                     out += fit(formatRate(inRate), width: colDown) + " "
                     out += fit(formatRate(outRate), width: colUp) + " "
                     out += fit(formatRate(totalRate), width: colTotal) + "\n"
                 }
-                let totalInRate = display.reduce(0.0) { $0 + (Double($1.bytesIn) / interval) }
-                let totalOutRate = display.reduce(0.0) { $0 + (Double($1.bytesOut) / interval) }
                 let totalRate = totalInRate + totalOutRate
-                out += String(repeating: "─", count: 4 + 1 + (colName - 5) + 1 + colDown + 1 + colUp + 1 + colTotal) + "\n"
+                out += tableSeparator + "\n"
                 out += fit("", width: 4) + " "
                 out += fit("TOTAL", width: colName - 5) + " "
                 out += fit(formatRate(totalInRate), width: colDown) + " "
@@ -184,7 +186,19 @@ extension Airtraffic {
         "\u{1B}[?6l\u{1B}[r\u{1B}[2J\u{1B}[1;1H"
     }
 
-    static func cumulativeHeaderLines() -> [String] {
+    static let liveHeaderLines: [String] = {
+        let no = fit("No.", width: 4)
+        let app = fit("App", width: colName - 5)
+        let down = fit("↓ Down/s", width: colDown)
+        let up = fit("↑ Up/s", width: colUp)
+        let tot = fit("Total/s", width: colTotal)
+        return [
+            "\(no) \(app) \(down) \(up) \(tot)",
+            tableSeparator,
+        ]
+    }()
+
+    static let cumulativeHeaderLines: [String] = {
         let no = fit("No.", width: 4)
         let app = fit("App", width: colName - 5)
         let down = fit("↓ Down", width: colDown)
@@ -192,9 +206,9 @@ extension Airtraffic {
         let tot = fit("Total", width: colTotal)
         return [
             "\(no) \(app) \(down) \(up) \(tot)",
-            String(repeating: "─", count: 4 + 1 + (colName - 5) + 1 + colDown + 1 + colUp + 1 + colTotal),
+            tableSeparator,
         ]
-    }
+    }()
 
     static func cumulativeRowLine(no: Int, name: String, bytesIn: UInt64, bytesOut: UInt64) -> String {
         let noCol = fit("\(no)", width: 4)
@@ -213,6 +227,9 @@ extension Airtraffic {
         let pageSize = 10
         let tty = openTTY()
         var currentPage = 0
+        // The default interval polls five times a second but the collector writes once a second;
+        // repainting an identical frame just clears and redraws the terminal for nothing.
+        var lastFrame = ""
 
         ttyWrite(tty, "\u{1B}[?1049h" + terminalResetPrefix())
         rawModeInputFD = STDIN_FILENO
@@ -247,14 +264,19 @@ extension Airtraffic {
                 let display = start < end ? Array(apps[start..<end]) : []
                 var out = terminalResetPrefix()
                 out += title + "\n\n"
-                for line in cumulativeHeaderLines() { out += line + "\n" }
+                for line in cumulativeHeaderLines { out += line + "\n" }
                 for (idx, row) in display.enumerated() {
                     let no = start + idx + 1
                     out += cumulativeRowLine(no: no, name: row.name, bytesIn: row.bytesIn, bytesOut: row.bytesOut) + "\n"
                 }
-                let totalIn = apps.reduce(UInt64(0)) { $0 + $1.bytesIn }
-                let totalOut = apps.reduce(UInt64(0)) { $0 + $1.bytesOut }
-                out += String(repeating: "─", count: 4 + 1 + (colName - 5) + 1 + colDown + 1 + colUp + 1 + colTotal) + "\n"
+                // Totals cover every app, not just this page.
+                var totalIn: UInt64 = 0
+                var totalOut: UInt64 = 0
+                for app in apps {
+                    totalIn += app.bytesIn
+                    totalOut += app.bytesOut
+                }
+                out += tableSeparator + "\n"
                 out += fit("", width: 4) + " "
                 out += fit("TOTAL", width: colName - 5) + " "
                 out += fit(formatBytes(totalIn), width: colDown) + " "
@@ -263,9 +285,16 @@ extension Airtraffic {
                 out += "\n"
                 out += "Page \(currentPage + 1)/\(totalPages)\n"
                 out += "Controls: → - Next, ← - Previous, Esc - Back"
-                ttyWrite(tty, out)
+                if out != lastFrame {
+                    ttyWrite(tty, out)
+                    lastFrame = out
+                }
             } else {
-                ttyWrite(tty, terminalResetPrefix() + "\(emptyMessage)\n\nEsc - Back")
+                let waiting = terminalResetPrefix() + "\(emptyMessage)\n\nEsc - Back"
+                if waiting != lastFrame {
+                    ttyWrite(tty, waiting)
+                    lastFrame = waiting
+                }
             }
             try? await Task.sleep(nanoseconds: UInt64(interval * 1_000_000_000))
         }
@@ -24,33 +24,26 @@ func parseBytes(_ s: String) -> UInt64? {
 }
 
 func formatBytesLimit(_ bytes: UInt64) -> String {
-    if bytes >= 1_000_000_000 {
-        return String(format: "%.2f GB", Double(bytes) / 1_000_000_000)
-    } else if bytes >= 1_000_000 {
-        return String(format: "%.2f MB", Double(bytes) / 1_000_000)
-    } else if bytes >= 1_000 {
-        return String(format: "%.2f KB", Double(bytes) / 1_000)
-    }
-    return "\(bytes) B"
+    Airtraffic.formatBytes(bytes)
 }
 
 // MARK: - airtraffic status
 
 struct StatusCommand {
     func run() {
-        guard let state = AirtrafficState.load() else {
+        guard let heartbeat = AirtrafficState.loadHeartbeat() else {
             print("App: not running (no state found).")
             return
         }
         let now = Date()
-        let active = now.timeIntervalSince(state.lastUpdate) < 10
+        let active = now.timeIntervalSince(heartbeat.lastUpdate) < 10
 
         print("App: \(active ? "running" : "not running")")
 
         let formatter = DateFormatter()
         formatter.dateStyle = .medium
         formatter.timeStyle = .medium
-        print("Running since: \(formatter.string(from: state.collectorStart))")
+        print("Running since: \(formatter.string(from: heartbeat.collectorStart))")
     }
 }
 
@@ -159,13 +152,14 @@ struct TodayCommand {
 
 struct MonthCommand {
     func run() async {
+        let formatter = DateFormatter()
+        formatter.locale = Locale(identifier: "en_US_POSIX")
+        formatter.dateFormat = "dd:MM:yyyy HH:mm"
+
         await Airtraffic.runLiveCumulative {
             guard let state = AirtrafficState.load(),
                   state.monthStart != nil else { return nil }
             guard !state.monthByApp.isEmpty else { return nil }
-            let formatter = DateFormatter()
-            formatter.locale = Locale(identifier: "en_US_POSIX")
-            formatter.dateFormat = "dd:MM:yyyy HH:mm"
             let apps = state.monthByApp
                 .map { (name: $0.key, bytesIn: $0.value.bytesIn, bytesOut: $0.value.bytesOut) }
                 .sorted { ($0.bytesIn + $0.bytesOut) > ($1.bytesIn + $1.bytesOut) }
@@ -435,16 +429,12 @@ struct UninstallCommand {
 
         Airtraffic.launchctlBootout()
         Airtraffic.killExistingDaemons()
-        if fm.fileExists(atPath: plistURL.path) {
-            try? fm.removeItem(at: plistURL)
-        }
+        try? fm.removeItem(at: plistURL)
 
         let base = fm.urls(for: .applicationSupportDirectory, in: .userDomainMask).first
             ?? URL(fileURLWithPath: NSHomeDirectory()).appendingPathComponent("Library/Application Support", isDirectory: true)
         let dataDir = base.appendingPathComponent("airtraffic", isDirectory: true)
-        if fm.fileExists(atPath: dataDir.path) {
-            try? fm.removeItem(at: dataDir)
-        }
+        try? fm.removeItem(at: dataDir)
 
         print("Uninstalled.")
     }
@@ -11,19 +11,24 @@ struct NettopParser {
         process.standardOutput = pipe
         process.standardError = FileHandle.nullDevice
         try process.run()
+        // Drain the pipe before waiting: a busy machine produces more rows than the pipe
+        // buffer holds, and nettop would block on write while we block on its exit.
+        let data = pipe.fileHandleForReading.readDataToEndOfFile()
         process.waitUntilExit()
 
-        let data = pipe.fileHandleForReading.readDataToEndOfFile()
         guard let output = String(data: data, encoding: .utf8) else { return [] }
 
         var rows: [(name: String, pid: Int32, bytesIn: UInt64, bytesOut: UInt64)] = []
-        let lines = output.split(separator: "\n", omittingEmptySubsequences: false).map(String.init)
+        let lines = output.split(separator: "\n", omittingEmptySubsequences: false)
         guard lines.count >= 2 else { return [] }
         let header = parseCSVLine(lines[0])
         let indexes = inferColumnIndexes(from: header)
+        // nettop emits a dozen more counters (dupes, retransmits, rtt, window sizes...) after the
+        // byte columns; stop splitting once the columns we read have been reached.
+        let fieldLimit = max(indexes.nameIndex, indexes.bytesInIndex, indexes.bytesOutIndex) + 1
 
         for line in lines.dropFirst(1) {
-            let parsed = parseCSVLine(line)
+            let parsed = parseCSVLine(line, maxFields: fieldLimit)
             guard parsed.count > indexes.bytesOutIndex,
                   let bytesIn = UInt64(parsed[indexes.bytesInIndex].trimmingCharacters(in: .whitespaces)),
                   let bytesOut = UInt64(parsed[indexes.bytesOutIndex].trimmingCharacters(in: .whitespaces)) else { continue }
@@ -82,7 +87,8 @@ struct NettopParser {
     }
 
     /// CSV parser that supports quoted fields and escaped quotes ("").
-    private func parseCSVLine(_ line: String) -> [String] {
+    /// Returns at most `maxFields` fields; the rest of the line is never scanned.
+    private func parseCSVLine<Line: StringProtocol>(_ line: Line, maxFields: Int = .max) -> [String] {
         var fields: [String] = []
         var current = ""
         var inQuotes = false
@@ -104,6 +110,7 @@ struct NettopParser {
 
             if ch == ",", !inQuotes {
                 fields.append(current)
+                if fields.count == maxFields { return fields }
                 current.removeAll(keepingCapacity: true)
             } else {
                 current.append(ch)
@@ -125,7 +132,12 @@ final class AppNameResolver {
         let groupKey: String
     }
 
+    /// Lowercased executable names of the daemons that sync on behalf of iCloud.
+    private static let iCloudSyncProcessNames: Set<String> = ["bird", "cloudd", "nsurlsessiond", "com.apple.bird"]
+
     private var cache: [Int32: Resolved] = [:]
+    /// friendlyName results keyed by raw name; every helper PID of an app shares one entry.
+    private var friendlyNames: [String: String] = [:]
     private let lock = NSLock()
 
     func resolve(forPID pid: Int32, fallbackProcessName: String) -> (displayName: String, groupKey: String) {
@@ -134,12 +146,12 @@ final class AppNameResolver {
     }
 
     private func _resolve(forPID pid: Int32, fallbackProcessName: String) -> Resolved {
+        lock.lock()
+        defer { lock.unlock() }
         guard pid > 0 else {
             let name = friendlyName(stripPID(from: fallbackProcessName))
             return Resolved(displayName: name, groupKey: name)
         }
-        lock.lock()
-        defer { lock.unlock() }
         if let cached = cache[pid] { return cached }
         let raw: String
         if let app = NSRunningApplication(processIdentifier: pid) {
@@ -166,12 +178,19 @@ final class AppNameResolver {
         return URL(fileURLWithPath: path).lastPathComponent
     }
 
-    /// Maps raw resolved names and daemon executable names to clean, user-facing labels.
+    /// Memoized `uncachedFriendlyName`. Callers must hold `lock`.
     private func friendlyName(_ raw: String) -> String {
+        if let cached = friendlyNames[raw] { return cached }
+        let name = uncachedFriendlyName(raw)
+        friendlyNames[raw] = name
+        return name
+    }
+
+    /// Maps raw resolved names and daemon executable names to clean, user-facing labels.
+    private func uncachedFriendlyName(_ raw: String) -> String {
         let lower = raw.lowercased()
 
-        if lower == "bird" || lower == "cloudd" || lower == "nsurlsessiond"
-            || lower == "com.apple.bird" || lower.hasPrefix("bird.") {
+        if Self.iCloudSyncProcessNames.contains(lower) || lower.hasPrefix("bird.") {
             return "iCloud Sync"
         }
 
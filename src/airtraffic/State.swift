@@ -43,26 +43,96 @@ struct AirtrafficState: Codable {
         notifiedLimits = []
     }
 
-    static func stateURL() -> URL {
+    /// ~/Library/Application Support/airtraffic, created on first use.
+    static let dataDirectory: URL = {
         let fm = FileManager.default
         let base = fm.urls(for: .applicationSupportDirectory, in: .userDomainMask).first
             ?? URL(fileURLWithPath: NSHomeDirectory()).appendingPathComponent("Library/Application Support", isDirectory: true)
         let dir = base.appendingPathComponent("airtraffic", isDirectory: true)
         try? fm.createDirectory(at: dir, withIntermediateDirectories: true)
-        return dir.appendingPathComponent("state.json")
+        return dir
+    }()
+
+    /// Writers call this again when a write fails: `uninstall` may have removed the directory
+    /// while a long-lived process (the shell or the collector) was still running.
+    static func createDataDirectory() {
+        try? FileManager.default.createDirectory(at: dataDirectory, withIntermediateDirectories: true)
+    }
+
+    private static let stateFileURL = dataDirectory.appendingPathComponent("state.json")
+
+    static func stateURL() -> URL {
+        stateFileURL
+    }
+
+    /// Identity of one version of state.json. Every persist renames a fresh file into place,
+    /// so a matching inode, size and mtime means the contents are unchanged.
+    private struct FileStamp: Equatable {
+        let inode: UInt64
+        let size: Int64
+        let seconds: Int
+        let nanoseconds: Int
+
+        init?(path: String) {
+            var info = stat()
+            guard stat(path, &info) == 0 else { return nil }
+            inode = UInt64(info.st_ino)
+            size = Int64(info.st_size)
+            seconds = info.st_mtimespec.tv_sec
+            nanoseconds = info.st_mtimespec.tv_nsec
+        }
+    }
+
+    /// Last state read or written by this process. The collector and the cumulative views poll
+    /// `load()` far more often than the file changes, so unchanged files skip the JSON decode.
+    private static var cached: (stamp: FileStamp, state: AirtrafficState)?
+
+    private static let decoder = JSONDecoder()
+    private static let encoder = JSONEncoder()
+
+    /// The two timestamps liveness and status checks read. Decoding only these skips building
+    /// the per-app usage maps, which is most of the work in a full decode.
+    struct Heartbeat: Decodable {
+        let collectorStart: Date
+        let lastUpdate: Date
     }
 
     static func load() -> AirtrafficState? {
         let url = stateURL()
+        guard let stamp = FileStamp(path: url.path) else { return nil }
+        if let cached, cached.stamp == stamp { return cached.state }
+        guard let data = try? Data(contentsOf: url),
+              let state = try? decoder.decode(AirtrafficState.self, from: data) else { return nil }
+        cached = (stamp, state)
+        return state
+    }
+
+    static func loadHeartbeat() -> Heartbeat? {
+        let url = stateURL()
+        guard let stamp = FileStamp(path: url.path) else { return nil }
+        if let cached, cached.stamp == stamp {
+            return Heartbeat(collectorStart: cached.state.collectorStart, lastUpdate: cached.state.lastUpdate)
+        }
         guard let data = try? Data(contentsOf: url) else { return nil }
-        return try? JSONDecoder().decode(AirtrafficState.self, from: data)
+        return try? decoder.decode(Heartbeat.self, from: data)
     }
 
     func persist() {
         let url = Self.stateURL()
-        if let data = try? JSONEncoder().encode(self) {
-            try? data.write(to: url, options: .atomic)
+        guard let data = try? Self.encoder.encode(self) else { return }
+        // Write-then-rename by hand (what `.atomic` does) so the stamp we cache is taken from our
+        // own file before it becomes visible, never from one another process swapped in after us.
+        let tmp = url.deletingLastPathComponent().appendingPathComponent(".state.json.\(getpid())")
+        if (try? data.write(to: tmp)) == nil {
+            Self.createDataDirectory()
+            guard (try? data.write(to: tmp)) != nil else { return }
         }
+        let stamp = FileStamp(path: tmp.path)
+        guard rename(tmp.path, url.path) == 0 else {
+            unlink(tmp.path)
+            return
+        }
+        if let stamp { Self.cached = (stamp, self) }
     }
 
     /// Reload only the fields that CLI commands can mutate while the daemon is running.
@@ -83,11 +153,21 @@ struct AirtrafficState: Codable {
 struct AppUsage: Codable {
     var bytesIn: UInt64
     var bytesOut: UInt64
+
+    static let zero = AppUsage(bytesIn: 0, bytesOut: 0)
+
+    /// Accumulates a delta in place, so `dict[key, default: .zero].add(...)` is a single lookup.
+    mutating func add(bytesIn dIn: UInt64, bytesOut dOut: UInt64) {
+        bytesIn &+= dIn
+        bytesOut &+= dOut
+    }
 }
 
 /// Installs a LaunchAgent so the collector runs automatically at login.
 enum LoginItemInstaller {
     static let label = "com.uvniche.airtraffic.collector"
+    /// The per-user launchd domain every launchctl call targets.
+    static let launchdDomain = "gui/\(getuid())"
 
     static var plistURL: URL {
         FileManager.default.homeDirectoryForCurrentUser
@@ -101,8 +181,7 @@ enum LoginItemInstaller {
         let executableURL = Airtraffic.currentExecutableURL()
         var shouldRewrite = true
 
-        if fm.fileExists(atPath: plistURL.path),
-           let data = try? Data(contentsOf: plistURL),
+        if let data = try? Data(contentsOf: plistURL),
            let plist = try? PropertyListSerialization.propertyList(from: data, format: nil) as? [String: Any],
            let args = plist["ProgramArguments"] as? [String],
            args.count >= 2,
@@ -115,9 +194,6 @@ enum LoginItemInstaller {
 
         do {
             try fm.createDirectory(at: plistURL.deletingLastPathComponent(), withIntermediateDirectories: true)
-            if fm.fileExists(atPath: plistURL.path) {
-                try? fm.removeItem(at: plistURL)
-            }
 
             let plist: [String: Any] = [
                 "Label": label,
@@ -133,11 +209,9 @@ enum LoginItemInstaller {
             )
             try data.write(to: plistURL, options: .atomic)
 
-            let uid = getuid()
-            let context = "gui/\(uid)"
             let proc = Process()
             proc.executableURL = URL(fileURLWithPath: "/bin/launchctl")
-            proc.arguments = ["bootstrap", context, plistURL.path]
+            proc.arguments = ["bootstrap", launchdDomain, plistURL.path]
             proc.standardOutput = FileHandle.nullDevice
             proc.standardError = FileHandle.nullDevice
             try? proc.run()